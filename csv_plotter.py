@@ -1,13 +1,13 @@
+import functools
+import io
+import os
 import sys
-import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.signal import savgol_filter
 from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QPushButton, 
                             QLabel, QFileDialog, QLineEdit, QMainWindow, QGridLayout, 
                             QComboBox, QMenu, QHBoxLayout, QScrollArea)
-from PyQt6.QtCore import QTimer, Qt
-from PyQt6.QtGui import QMouseEvent, QAction
+from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QObject, QRunnable, QThreadPool
+from PyQt6.QtGui import QMouseEvent, QAction, QResizeEvent
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
@@ -17,6 +17,172 @@ except ImportError:
     from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas, NavigationToolbar2QT as NavigationToolbar
 
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+# Unit conversion factors relative to the base units (s, mm, 1/s)
+TIME_FACTORS = {'s': 1.0, 'min': 60.0, 'hour': 3600.0}  # Seconds per unit
+DIAMETER_FACTORS = {'mm': 1.0, 'μm': 1000.0}  # Units per mm
+RATE_FACTORS = {'1/s': 1.0, '1/min': 60.0, '1/hour': 3600.0,
+                'μm/s': 1000.0, 'μm/min': 60000.0, 'μm/hour': 3.6e6}
+
+# (x, y) calculated_data columns shown by each plot line
+LINE_COLUMNS = {'diameter': (0, 1), 'strain': (0, 2), 'strain_rate': (0, 3), 'creep': (2, 3)}
+
+# Bytes kept from each end of the parsed CSV prefix to detect files rewritten in place
+FINGERPRINT_BYTES = 1024
+
+# Savitzky-Golay (window 5, polyorder 2) smoothing coefficients
+SG_5_2 = np.array([-3, 12, 17, 12, -3], dtype=np.float64) / 35.0
+# Polynomial-fit rows for the first two samples; the last two use the reversed rows
+SG_5_2_EDGE = np.array([[31, 9, -3, -5, 3], [9, 13, 12, 6, -5]], dtype=np.float64) / 35.0
+
+
+def smooth_diameter(diameter):
+    # Same result as savgol_filter(diameter, 5, 2) with its default 'interp' edge handling
+    if len(diameter) < 5:
+        raise ValueError("At least 5 data rows are required for smoothing")
+    smoothed = np.convolve(diameter, SG_5_2, mode='same')
+    smoothed[:2] = SG_5_2_EDGE @ diameter[:5]
+    smoothed[-2:] = SG_5_2_EDGE[::-1, ::-1] @ diameter[-5:]
+    return smoothed
+
+
+def central_difference(y, t):
+    # Central differences inside, one-sided at the ends; matches np.gradient for evenly spaced t
+    dydt = np.empty_like(y)
+    np.subtract(y[2:], y[:-2], out=dydt[1:-1])
+    dydt[1:-1] /= t[2:] - t[:-2]
+    dydt[0] = (y[1] - y[0]) / (t[1] - t[0])
+    dydt[-1] = (y[-1] - y[-2]) / (t[-1] - t[-2])
+    return dydt
+
+
+def _compute_base_loop(time, diameter, initial_diameter):
+    # Single pass over the data; strain_rate[i - 1] is written as soon as strain[i] is known
+    n = diameter.shape[0]
+    diameter_smooth = np.empty(n)
+    strain = np.empty(n)
+    strain_rate = np.empty(n)
+    for i in range(n):
+        acc = 0.0
+        if i < 2:
+            for k in range(5):
+                acc += SG_5_2_EDGE[i, k] * diameter[k]
+        elif i >= n - 2:
+            for k in range(5):
+                acc += SG_5_2_EDGE[n - 1 - i, 4 - k] * diameter[n - 5 + k]
+        else:
+            for k in range(5):
+                acc += SG_5_2[k] * diameter[i - 2 + k]
+        diameter_smooth[i] = acc
+        strain[i] = (acc - initial_diameter) / initial_diameter
+        if i >= 2:
+            strain_rate[i - 1] = (strain[i] - strain[i - 2]) / (time[i] - time[i - 2])
+    strain_rate[0] = (strain[1] - strain[0]) / (time[1] - time[0])
+    strain_rate[n - 1] = (strain[n - 1] - strain[n - 2]) / (time[n - 1] - time[n - 2])
+    return diameter_smooth, strain, strain_rate
+
+
+@functools.lru_cache(maxsize=None)
+def _fused_kernel():
+    # numba is imported (and the kernel compiled) on first use; None if it is not installed
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    # NumPy error model: repeated timestamps or a zero initial diameter give inf/nan
+    # like the NumPy path instead of raising ZeroDivisionError
+    return njit(cache=True, error_model='numpy')(_compute_base_loop)
+
+
+@functools.lru_cache(maxsize=None)
+def _pyarrow_csv():
+    # (pyarrow, pyarrow.csv) imported on the first full read; None if pyarrow is not installed
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None
+    return pa, pacsv
+
+
+def compute_base(time, diameter, initial_diameter):
+    # Smoothed diameter (mm), diametrical strain (unitless) and strain rate (1/s)
+    kernel = _fused_kernel()
+    if kernel is not None:
+        if len(diameter) < 5:
+            raise ValueError("At least 5 data rows are required for smoothing")
+        return kernel(np.ascontiguousarray(time, dtype=np.float64),
+                      np.ascontiguousarray(diameter, dtype=np.float64),
+                      float(initial_diameter))
+    diameter_smooth = smooth_diameter(diameter)
+    strain = (diameter_smooth - initial_diameter) / initial_diameter
+    return diameter_smooth, strain, central_difference(strain, time)
+
+
+def downsample(x, y, max_points):
+    # Min/max decimation to about max_points samples for display: each bucket keeps the
+    # samples with its lowest and highest x and y, so peaks and the autoscaled limits
+    # survive even when x is not monotonic (creep rate vs strain). The first and last
+    # samples are always kept, and samples stay in their original order.
+    n = len(x)
+    if n <= max(4, max_points):
+        return x, y
+    step = -(-4 * n // max(4, max_points))  # Four samples per bucket, rounded up
+    n_full = n - n % step
+    starts = np.arange(0, n_full, step)
+    keep = [[0, n - 1]]
+    for values in (x, y):
+        buckets = values[:n_full].reshape(-1, step)
+        keep += [starts + buckets.argmin(axis=1), starts + buckets.argmax(axis=1)]
+        if n_full < n:
+            keep += [[n_full + np.argmin(values[n_full:]), n_full + np.argmax(values[n_full:])]]
+    idx = np.unique(np.concatenate(keep))
+    return x[idx], y[idx]
+
+
+def _snapshot_data(calculated_data):
+    # calculated_data is rewritten in place when units change; pop-out windows keep
+    # their own copy so they stay in the units they were opened with
+    return None if calculated_data is None else calculated_data.copy(order='F')
+
+
+def attach_figure(figure, canvas):
+    # Make canvas the one figure draws to (e.g. back from the fullscreen "All" view)
+    # and size the figure to it, as the canvas' own resize handling would
+    figure.set_canvas(canvas)
+    canvas.resizeEvent(QResizeEvent(canvas.size(), canvas.size()))
+
+
+def single_plot_figure(ax, index, calculated_data):
+    # Standalone copy of one 2x2 subplot. Line data is taken from the full-resolution
+    # calculated_data columns (or the line's own arrays) without intermediate copies
+    new_fig = Figure(figsize=(8, 6))
+    new_ax = new_fig.add_subplot(111)
+    x_col, y_col = list(LINE_COLUMNS.values())[index]
+    for line in ax.get_lines():
+        if calculated_data is not None:
+            xdata, ydata = calculated_data[:, x_col], calculated_data[:, y_col]
+        else:
+            xdata, ydata = line.get_xdata(orig=True), line.get_ydata(orig=True)
+        new_ax.add_line(Line2D(xdata, ydata, color=line.get_color(), label=line.get_label()))
+    new_ax.set_xlabel(ax.get_xlabel())
+    new_ax.set_ylabel(ax.get_ylabel())
+    new_ax.set_xscale(ax.get_xscale())
+    new_ax.set_yscale(ax.get_yscale())
+    new_ax.set_xlim(ax.get_xlim())
+    new_ax.set_ylim(ax.get_ylim())
+    new_ax.legend()
+    return new_fig
+
+
+def write_ascii(file_path, calculated_data, time_unit, diameter_unit, strain_rate_unit):
+    # Tab-separated export of the (N, 4) time/diameter/strain/strain rate array;
+    # 17 significant digits round-trip every float64 exactly
+    header = (f"Time ({time_unit})\tDiameter ({diameter_unit})\t"
+              f"Diametrical Strain (unitless)\tStrain Rate ({strain_rate_unit})")
+    np.savetxt(file_path, calculated_data, fmt='%.17g', delimiter='\t',
+               header=header, comments='', encoding='utf-8')
 
 
 class FullScreenPlot(QMainWindow):
@@ -26,8 +192,15 @@ class FullScreenPlot(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
         self.figure = figure
         self.ax_index = ax_index
-        self.calculated_data = calculated_data
+        # A single-plot window is handed its own copy (see _snapshot_data); the "All" view
+        # shows the main figure, so it reads the main window's live data instead
+        self.calculated_data = calculated_data if ax_index != "All" else None
         self.parent_widget = parent
+
+        # Debounce range edits so typing a value redraws once
+        self._range_timer = QTimer(self)
+        self._range_timer.setSingleShot(True)
+        self._range_timer.timeout.connect(self.update_ranges)
         
         main_layout = QVBoxLayout()
         
@@ -35,6 +208,7 @@ class FullScreenPlot(QMainWindow):
         root_parent = parent
         while isinstance(root_parent, FullScreenPlot) and root_parent.parent_widget:
             root_parent = root_parent.parent_widget
+        self.root_parent = root_parent
         
         if ax_index != "All":
             control_layout = QHBoxLayout()
@@ -54,10 +228,10 @@ class FullScreenPlot(QMainWindow):
             
             self.x_scale_combo.currentTextChanged.connect(self.update_scales)
             self.y_scale_combo.currentTextChanged.connect(self.update_scales)
-            self.x_min_input.textChanged.connect(self.update_ranges)
-            self.x_max_input.textChanged.connect(self.update_ranges)
-            self.y_min_input.textChanged.connect(self.update_ranges)
-            self.y_max_input.textChanged.connect(self.update_ranges)
+            self.x_min_input.textChanged.connect(lambda: self._range_timer.start(100))
+            self.x_max_input.textChanged.connect(lambda: self._range_timer.start(100))
+            self.y_min_input.textChanged.connect(lambda: self._range_timer.start(100))
+            self.y_max_input.textChanged.connect(lambda: self._range_timer.start(100))
             
             control_layout.addWidget(QLabel("X Scale:"))
             control_layout.addWidget(self.x_scale_combo)
@@ -70,21 +244,21 @@ class FullScreenPlot(QMainWindow):
 
             # Add unit selection for individual plots
             self.time_unit_combo = QComboBox()
-            self.time_unit_combo.addItems(['s', 'min', 'hour'])
+            self.time_unit_combo.addItems(list(TIME_FACTORS))
             self.time_unit_combo.setCurrentText(root_parent.time_unit_combo.currentText())
             self.time_unit_combo.currentTextChanged.connect(self.update_plot)
             control_layout.addWidget(QLabel("Time Unit:"))
             control_layout.addWidget(self.time_unit_combo)
 
             self.diameter_unit_combo = QComboBox()
-            self.diameter_unit_combo.addItems(['mm', 'μm'])
+            self.diameter_unit_combo.addItems(list(DIAMETER_FACTORS))
             self.diameter_unit_combo.setCurrentText(root_parent.diameter_unit_combo.currentText())
             self.diameter_unit_combo.currentTextChanged.connect(self.update_plot)
             control_layout.addWidget(QLabel("Diameter Unit:"))
             control_layout.addWidget(self.diameter_unit_combo)
 
             self.strain_rate_unit_combo = QComboBox()
-            self.strain_rate_unit_combo.addItems(['1/s', '1/min', '1/hour', 'μm/s', 'μm/min', 'μm/hour'])
+            self.strain_rate_unit_combo.addItems(list(RATE_FACTORS))
             self.strain_rate_unit_combo.setCurrentText(root_parent.strain_rate_unit_combo.currentText())
             self.strain_rate_unit_combo.currentTextChanged.connect(self.update_plot)
             control_layout.addWidget(QLabel("Strain Rate Unit:"))
@@ -110,6 +284,49 @@ class FullScreenPlot(QMainWindow):
     def show_full_screen(self):
         self.showMaximized()
 
+    def closeEvent(self, event):
+        if self.ax_index == "All":
+            # Return the shared figure to the main window so it blits again
+            attach_figure(self.figure, self.parent_widget.canvas)
+        super().closeEvent(event)
+
+    def _current_data(self):
+        if self.ax_index == "All":
+            return self.parent_widget.calculated_data
+        return self.calculated_data
+
+    def update_data(self, ax, calculated_data, index):
+        # Bring a reused single-plot window to the state a new one built from ax would have
+        self.calculated_data = _snapshot_data(calculated_data)
+        if not self.figure.axes:
+            return
+        new_ax = self.figure.axes[0]
+        if self.calculated_data is not None:
+            x_col, y_col = list(LINE_COLUMNS.values())[index]
+            new_ax.get_lines()[0].set_data(self.calculated_data[:, x_col], self.calculated_data[:, y_col])
+        new_ax.set_xlabel(ax.get_xlabel())
+        new_ax.set_ylabel(ax.get_ylabel())
+        new_ax.set_xscale(ax.get_xscale())
+        new_ax.set_yscale(ax.get_yscale())
+        new_ax.set_xlim(ax.get_xlim())
+        new_ax.set_ylim(ax.get_ylim())
+
+        # Sync the controls without triggering the replots they are connected to
+        controls = [(self.time_unit_combo, self.root_parent.time_unit_combo.currentText()),
+                    (self.diameter_unit_combo, self.root_parent.diameter_unit_combo.currentText()),
+                    (self.strain_rate_unit_combo, self.root_parent.strain_rate_unit_combo.currentText()),
+                    (self.x_scale_combo, ax.get_xscale().capitalize()),
+                    (self.y_scale_combo, ax.get_yscale().capitalize())]
+        for combo, text in controls:
+            combo.blockSignals(True)
+            combo.setCurrentText(text)
+            combo.blockSignals(False)
+        for range_input in (self.x_min_input, self.x_max_input, self.y_min_input, self.y_max_input):
+            range_input.blockSignals(True)
+            range_input.clear()
+            range_input.blockSignals(False)
+        self.canvas.draw_idle()
+
     def show_context_menu(self, pos):
         menu = QMenu(self)
         export_ascii = QAction("Export to ASCII", self)
@@ -124,17 +341,15 @@ class FullScreenPlot(QMainWindow):
         menu.exec(self.canvas.mapToGlobal(pos))
 
     def export_to_ascii(self):
-        if self.calculated_data is None:
+        calculated_data = self._current_data()
+        if calculated_data is None:
             return
         file_path, _ = QFileDialog.getSaveFileName(self, "Save ASCII File", "", "Text Files (*.txt)")
         if file_path:
-            with open(file_path, 'w') as f:
-                time_unit = self.time_unit_combo.currentText() if self.ax_index != "All" else self.parent_widget.time_unit_combo.currentText()
-                diameter_unit = self.diameter_unit_combo.currentText() if self.ax_index != "All" else self.parent_widget.diameter_unit_combo.currentText()
-                strain_rate_unit = self.strain_rate_unit_combo.currentText() if self.ax_index != "All" else self.parent_widget.strain_rate_unit_combo.currentText()
-                f.write(f"Time ({time_unit})\tDiameter ({diameter_unit})\tDiametrical Strain (unitless)\tStrain Rate ({strain_rate_unit})\n")
-                for t, d, ds, sr in zip(*self.calculated_data):
-                    f.write(f"{t}\t{d}\t{ds}\t{sr}\n")
+            time_unit = self.time_unit_combo.currentText() if self.ax_index != "All" else self.parent_widget.time_unit_combo.currentText()
+            diameter_unit = self.diameter_unit_combo.currentText() if self.ax_index != "All" else self.parent_widget.diameter_unit_combo.currentText()
+            strain_rate_unit = self.strain_rate_unit_combo.currentText() if self.ax_index != "All" else self.parent_widget.strain_rate_unit_combo.currentText()
+            write_ascii(file_path, calculated_data, time_unit, diameter_unit, strain_rate_unit)
 
     def export_to_pdf(self):
         file_path, _ = QFileDialog.getSaveFileName(self, "Save PDF File", "", "PDF Files (*.pdf)")
@@ -155,19 +370,9 @@ class FullScreenPlot(QMainWindow):
         
         for i, ax in enumerate(self.figure.axes):
             if ax.contains_point((x, y)):
-                new_fig = Figure(figsize=(8, 6))
-                new_ax = new_fig.add_subplot(111)
-                for line in ax.get_lines():
-                    new_ax.plot(line.get_xdata(), line.get_ydata(), line.get_color(), label=line.get_label())
-                new_ax.set_xlabel(ax.get_xlabel())
-                new_ax.set_ylabel(ax.get_ylabel())
-                new_ax.set_xscale(ax.get_xscale())
-                new_ax.set_yscale(ax.get_yscale())
-                new_ax.set_xlim(ax.get_xlim())
-                new_ax.set_ylim(ax.get_ylim())
-                new_ax.legend()
-                
-                new_window = FullScreenPlot(new_fig, f"Plot {i+1}", self.calculated_data, self)
+                calculated_data = _snapshot_data(self._current_data())
+                new_fig = single_plot_figure(ax, i, calculated_data)
+                new_window = FullScreenPlot(new_fig, f"Plot {i+1}", calculated_data, self)
                 new_window.show_full_screen()
                 break
 
@@ -203,9 +408,9 @@ class FullScreenPlot(QMainWindow):
             self.canvas.draw()
 
     def update_plot(self):
-        if self.ax_index != "All" and self.calculated_data and self.figure.axes:
+        if self.ax_index != "All" and self.calculated_data is not None and self.figure.axes:
             ax = self.figure.axes[0]
-            time, diameter, diametrical_strain, strain_rate = self.calculated_data
+            time, diameter, diametrical_strain, strain_rate = self.calculated_data.T
             ax.clear()
             
             time_unit = self.time_unit_combo.currentText()
@@ -237,8 +442,17 @@ class FullScreenPlot(QMainWindow):
 
 
 class CSVPlotter(QWidget):
+    # Emitted from the watchdog thread; delivered on the GUI thread
+    file_modified = pyqtSignal(object)
+
     def __init__(self):
         super().__init__()
+        self.file_modified.connect(self._on_file_modified)
+        # Debounce control changes so bursts of signals trigger a single replot
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        self._units_changed = False
         self.initUI()
         self.csv_file = None
         self.initial_diameter = None
@@ -247,6 +461,7 @@ class CSVPlotter(QWidget):
         self.timer = QTimer()
         self.timer.timeout.connect(self.manual_refresh)
         self.fixed_data = None
+        self._fullscreen_cache = {}  # ax index (or "All") -> FullScreenPlot
         self.calculated_data = None
         self.scales = {
             (0,0): ['linear', 'linear'],
@@ -300,23 +515,27 @@ class CSVPlotter(QWidget):
         # Unit selection controls
         unit_layout = QHBoxLayout()
         self.time_unit_combo = QComboBox()
-        self.time_unit_combo.addItems(['s', 'min', 'hour'])
-        self.time_unit_combo.currentTextChanged.connect(self.manual_refresh)
+        self.time_unit_combo.addItems(list(TIME_FACTORS))
+        self.time_unit_combo.currentTextChanged.connect(self.update_unit_scales)
+        self.time_unit_combo.currentTextChanged.connect(lambda: self.schedule_refresh(units_changed=True))
         unit_layout.addWidget(QLabel("Time Unit:"))
         unit_layout.addWidget(self.time_unit_combo)
 
         self.diameter_unit_combo = QComboBox()
-        self.diameter_unit_combo.addItems(['mm', 'μm'])
-        self.diameter_unit_combo.currentTextChanged.connect(self.manual_refresh)
+        self.diameter_unit_combo.addItems(list(DIAMETER_FACTORS))
+        self.diameter_unit_combo.currentTextChanged.connect(self.update_unit_scales)
+        self.diameter_unit_combo.currentTextChanged.connect(lambda: self.schedule_refresh(units_changed=True))
         unit_layout.addWidget(QLabel("Diameter Unit:"))
         unit_layout.addWidget(self.diameter_unit_combo)
 
         self.strain_rate_unit_combo = QComboBox()
-        self.strain_rate_unit_combo.addItems(['1/s', '1/min', '1/hour', 'μm/s', 'μm/min', 'μm/hour'])
-        self.strain_rate_unit_combo.currentTextChanged.connect(self.manual_refresh)
+        self.strain_rate_unit_combo.addItems(list(RATE_FACTORS))
+        self.strain_rate_unit_combo.currentTextChanged.connect(self.update_unit_scales)
+        self.strain_rate_unit_combo.currentTextChanged.connect(lambda: self.schedule_refresh(units_changed=True))
         unit_layout.addWidget(QLabel("Strain Rate Unit:"))
         unit_layout.addWidget(self.strain_rate_unit_combo)
         main_layout.addLayout(unit_layout)
+        self.update_unit_scales()
 
         # Scrollable area for plots and controls
         scroll_widget = QWidget()
@@ -365,10 +584,32 @@ class CSVPlotter(QWidget):
             scale_layout.addWidget(y_max, i, 8)
         scroll_layout.addLayout(scale_layout)
 
-        self.figure = Figure(figsize=(8, 8))  # Adjusted for better aspect ratio
+        self.figure = Figure(figsize=(8, 8), layout='constrained')  # Adjusted for better aspect ratio
         self.canvas = FigureCanvas(self.figure)
         self.toolbar = NavigationToolbar(self.canvas, self)
 
+        # Axes and lines are created once; refreshes only update line data
+        self.axs = self.figure.subplots(2, 2)
+        self.lines = {
+            'diameter': self.axs[0, 0].plot([], [], 'b-', label='Absolute Diameter')[0],
+            'strain': self.axs[0, 1].plot([], [], 'r-', label='Diametrical Strain')[0],
+            'strain_rate': self.axs[1, 0].plot([], [], 'g-', label='Strain Rate')[0],
+            'creep': self.axs[1, 1].plot([], [], 'm-', label='Creep Rate vs Strain')[0]
+        }
+        for ax in self.axs.flat:
+            ax.legend()
+
+        # Per-axes backgrounds (without lines) used for blitting data-only refreshes
+        self._backgrounds = None
+        self._view_state = None
+        self._capture_pending = False
+        self.canvas.mpl_connect('resize_event', self._on_resize)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+        # Re-sample the displayed points when zooming changes the visible x range
+        for name, line in self.lines.items():
+            line.axes.callbacks.connect('xlim_changed', lambda ax, name=name: self._resample_line(name))
+
         self.canvas.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.canvas.customContextMenuRequested.connect(self.show_context_menu)
 
@@ -440,13 +681,45 @@ class CSVPlotter(QWidget):
         self.label.setText(f"Manual refresh started (interval: {self.manual_refresh_rate / 1000} s)")
         self.event_handler.plot_data()  # Initial plot
 
+    def update_unit_scales(self):
+        # Fold the selected units into one scalar per column (time, diameter, strain rate)
+        time_factor = TIME_FACTORS[self.time_unit_combo.currentText()]
+        self.unit_scales = (1.0 / time_factor,
+                            DIAMETER_FACTORS[self.diameter_unit_combo.currentText()],
+                            time_factor * RATE_FACTORS[self.strain_rate_unit_combo.currentText()])
+
+    def _on_file_modified(self, handler):
+        # Coalesce the burst of events a single write produces (flush, close, ...)
+        QTimer.singleShot(200, handler.flush)
+
+    def schedule_refresh(self, units_changed=False):
+        self._units_changed = self._units_changed or units_changed
+        self._refresh_timer.start(100)  # Restarts the countdown if already pending
+
+    def _do_refresh(self):
+        # Unit changes rescale the lines; scale/range changes only touch the axes
+        if self.csv_file and self.event_handler:
+            if self._units_changed:
+                self.event_handler.update_units()
+            else:
+                self.event_handler.update_axes()
+        self._units_changed = False
+
     def manual_refresh(self):
         if self.csv_file and self.event_handler:
             self.event_handler.plot_data()
 
     def open_fullscreen_plot(self):
-        self.fullscreen_window = FullScreenPlot(self.figure, "All", self.calculated_data, self)
-        self.fullscreen_window.show_full_screen()
+        window = self._fullscreen_cache.get("All")
+        if window is None:
+            window = FullScreenPlot(self.figure, "All", self.calculated_data, self)
+            self._fullscreen_cache["All"] = window
+        else:
+            attach_figure(self.figure, window.canvas)
+        self.fullscreen_window = window
+        window.show_full_screen()
+        window.raise_()
+        window.activateWindow()
 
     def double_click_plot(self, event: QMouseEvent):
         if not self.figure.axes:
@@ -457,26 +730,25 @@ class CSVPlotter(QWidget):
         
         for i, ax in enumerate(self.figure.axes):
             if ax.contains_point((x, y)):
-                new_fig = Figure(figsize=(8, 6))
-                new_ax = new_fig.add_subplot(111)
-                for line in ax.get_lines():
-                    new_ax.plot(line.get_xdata(), line.get_ydata(), line.get_color(), label=line.get_label())
-                new_ax.set_xlabel(ax.get_xlabel())
-                new_ax.set_ylabel(ax.get_ylabel())
-                new_ax.set_xscale(ax.get_xscale())
-                new_ax.set_yscale(ax.get_yscale())
-                new_ax.set_xlim(ax.get_xlim())
-                new_ax.set_ylim(ax.get_ylim())
-                new_ax.legend()
-                
-                self.fullscreen_window = FullScreenPlot(new_fig, f"Plot {i+1}", self.calculated_data, self)
-                self.fullscreen_window.show_full_screen()
+                # Reuse the window built for this plot on an earlier double-click
+                window = self._fullscreen_cache.get(i)
+                if window is None:
+                    calculated_data = _snapshot_data(self.calculated_data)
+                    new_fig = single_plot_figure(ax, i, calculated_data)
+                    window = FullScreenPlot(new_fig, f"Plot {i+1}", calculated_data, self)
+                    self._fullscreen_cache[i] = window
+                else:
+                    window.update_data(ax, self.calculated_data, i)
+                self.fullscreen_window = window
+                window.show_full_screen()
+                window.raise_()
+                window.activateWindow()
                 break
 
     def update_scale(self, position, axis, scale):
         idx = 0 if axis == 'x' else 1
         self.scales[position][idx] = scale
-        self.manual_refresh()
+        self.schedule_refresh()
 
     def update_range(self, position, axis, value):
         idx = {'x_min': 0, 'x_max': 1, 'y_min': 2, 'y_max': 3}[axis]
@@ -484,7 +756,70 @@ class CSVPlotter(QWidget):
             self.ranges[position][idx] = float(value) if value else None
         except ValueError:
             self.ranges[position][idx] = None
-        self.manual_refresh()
+        self.schedule_refresh()
+
+    def _on_resize(self, event):
+        self._backgrounds = None
+        self.update_display_data()
+
+    def _resample_line(self, name):
+        if self.calculated_data is None:
+            return
+        x_col, y_col = LINE_COLUMNS[name]
+        x = self.calculated_data[:, x_col]
+        line = self.lines[name]
+        # Aim for ~2 points per pixel of the visible x range, not of the whole trace
+        x_min, x_max = line.axes.get_xlim()
+        visible = max(1, np.count_nonzero((x >= x_min) & (x <= x_max)))
+        max_points = int(line.axes.bbox.width * 2) * len(x) // visible
+        line.set_data(*downsample(x, self.calculated_data[:, y_col], max_points))
+
+    def update_display_data(self):
+        # Lines get a decimated view; calculated_data keeps full resolution for export
+        for name in self.lines:
+            self._resample_line(name)
+
+    def _current_view_state(self):
+        return tuple((ax.get_xlim(), ax.get_ylim(), ax.get_xscale(), ax.get_yscale(),
+                      ax.get_xlabel(), ax.get_ylabel()) for ax in self.axs.flat)
+
+    def redraw_plots(self):
+        # Full redraw only when limits, scales or labels changed; otherwise blit the lines
+        if self.figure.canvas is not self.canvas:
+            # The figure is currently attached to another canvas (fullscreen "All" view)
+            self._backgrounds = None
+            self.canvas.draw_idle()
+            self.figure.canvas.draw_idle()
+            return
+
+        if self._capture_pending:
+            return  # The pending idle draw already picks up the new line data
+
+        if self._backgrounds is None or self._current_view_state() != self._view_state:
+            # Draw without the lines; _on_draw captures the backgrounds and adds them back.
+            # draw_idle coalesces several requests into one draw on the next event-loop pass
+            for line in self.lines.values():
+                line.set_visible(False)
+            self._capture_pending = True
+            self.canvas.draw_idle()
+            return
+
+        for ax, line, background in zip(self.axs.flat, self.lines.values(), self._backgrounds):
+            self.canvas.restore_region(background)
+            ax.draw_artist(line)
+            ax.draw_artist(ax.get_legend())
+            self.canvas.blit(ax.bbox)
+
+    def _on_draw(self, event):
+        if not self._capture_pending:
+            return
+        self._capture_pending = False
+        self._backgrounds = [self.canvas.copy_from_bbox(ax.bbox) for ax in self.axs.flat]
+        self._view_state = self._current_view_state()
+        for ax, line in zip(self.axs.flat, self.lines.values()):
+            line.set_visible(True)
+            ax.draw_artist(line)
+            ax.draw_artist(ax.get_legend())
 
     def show_context_menu(self, pos):
         menu = QMenu(self)
@@ -500,102 +835,236 @@ class CSVPlotter(QWidget):
 
         file_path, _ = QFileDialog.getSaveFileName(self, "Save ASCII File", "", "Text Files (*.txt)")
         if file_path:
-            with open(file_path, 'w') as f:
-                time_unit = self.time_unit_combo.currentText()
-                diameter_unit = self.diameter_unit_combo.currentText()
-                strain_rate_unit = self.strain_rate_unit_combo.currentText()
-                f.write(f"Time ({time_unit})\tDiameter ({diameter_unit})\tDiametrical Strain (unitless)\tStrain Rate ({strain_rate_unit})\n")
-                for t, d, ds, sr in zip(*self.calculated_data):
-                    f.write(f"{t}\t{d}\t{ds}\t{sr}\n")
+            write_ascii(file_path, self.calculated_data, self.time_unit_combo.currentText(),
+                        self.diameter_unit_combo.currentText(), self.strain_rate_unit_combo.currentText())
             self.label.setText(f"Data exported to {file_path}")
 
 
+class PlotWorkerSignals(QObject):
+    finished = pyqtSignal()
+    error = pyqtSignal(str)
+
+
+class PlotWorker(QRunnable):
+    # Runs CSVEventHandler.compute (file read + smoothing) off the GUI thread
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+        self.signals = PlotWorkerSignals()
+
+    def run(self):
+        try:
+            self.handler.compute()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit()
+
+
 class CSVEventHandler(FileSystemEventHandler):
     def __init__(self, file_path, initial_diameter, parent):
         self.file_path = file_path
         self.initial_diameter = initial_diameter  # In mm
         self.parent = parent
+        self._cache = None  # ((file_path, mtime_ns, size), base-unit arrays)
+        self._last_units = None  # (time, diameter, strain rate) units of the current axis labels
+        self._last_offset = 0  # Byte offset just past the last complete parsed line
+        self._cached_arrays = None  # (time, diameter, diameter_smooth, strain, strain_rate) parsed so far
+        self._n_complete = 0  # Leading rows of _cached_arrays that came from newline-terminated lines
+        self._fingerprint = None  # (first, last) bytes of the parsed prefix, to detect rewrites
+        self._out = None  # (N, 4) converted-unit buffer, reused while the row count is unchanged
+        self._last_size = 0  # File size when last read or notified
+        self._pending = False  # A coalesced refresh is already scheduled
+        self._inflight = False  # A PlotWorker is currently computing
+        self._rerun = False  # plot_data was requested while the worker was busy
+        self._worker = None  # Keeps the latest worker (and its signals object) alive
 
     def on_modified(self, event):
         if event.src_path == self.file_path:
+            try:
+                size = os.path.getsize(self.file_path)
+            except OSError:
+                return  # Deleted or replaced mid-write; a later event picks up the new file
+            if size == self._last_size:
+                return
+            self._last_size = size
+            if self._pending:
+                return
+            self._pending = True
             print(f"Detected modification: {self.file_path}")
-            self.plot_data()
+            self.parent.file_modified.emit(self)
 
-    def plot_data(self):
-        self.parent.figure.clear()
-        axs = self.parent.figure.subplots(2, 2)
-        
+    def flush(self):
+        self._pending = False
+        if self.is_stale():
+            return
+        self._cache = None
+        self.plot_data()
+
+    def _parse_rows(self, buffer, header):
+        # Parse only the time and diameter columns with fixed dtypes
+        import pandas as pd  # Deferred: only needed once data is read
         try:
-            if self.file_path:
-                df = pd.read_csv(self.file_path).dropna()
-                print(f"CSV rows: {len(df)}")  # Debug: Check data size
-                time = df.iloc[:, 0].values  # Time in seconds (base unit)
-                diameter = df.iloc[:, 1].values  # Diameter in mm
-
-                # Smooth diameter
-                diameter_smooth = savgol_filter(diameter, 5, 2)
-
-                # Convert time based on selected unit
-                time_unit = self.parent.time_unit_combo.currentText()
-                if time_unit == 's':
-                    time_converted = time
-                    time_factor = 1
-                elif time_unit == 'min':
-                    time_converted = time / 60  # s to min
-                    time_factor = 60
-                elif time_unit == 'hour':
-                    time_converted = time / 3600  # s to hour
-                    time_factor = 3600
-
-                # Convert diameter based on selected unit
-                diameter_unit = self.parent.diameter_unit_combo.currentText()
-                if diameter_unit == 'μm':
-                    diameter_converted = diameter_smooth * 1000  # mm to μm
-                    initial_diameter_converted = self.initial_diameter * 1000
-                else:  # mm
-                    diameter_converted = diameter_smooth
-                    initial_diameter_converted = self.initial_diameter
-
-                # Calculate diametrical strain (unitless)
-                diametrical_strain = (diameter_converted - initial_diameter_converted) / initial_diameter_converted
-
-                # Calculate strain rate and convert based on selected unit
-                strain_rate_unit = self.parent.strain_rate_unit_combo.currentText()
-                strain_rate = np.gradient(diametrical_strain, time)  # Base strain rate in 1/s
-                if strain_rate_unit == '1/s':
-                    strain_rate_converted = strain_rate * time_factor  # Adjust for time unit
-                elif strain_rate_unit == '1/min':
-                    strain_rate_converted = strain_rate * time_factor * 60
-                elif strain_rate_unit == '1/hour':
-                    strain_rate_converted = strain_rate * time_factor * 3600
-                elif strain_rate_unit == 'μm/s':
-                    strain_rate_converted = strain_rate * time_factor * 1000
-                elif strain_rate_unit == 'μm/min':
-                    strain_rate_converted = strain_rate * time_factor * 1000 * 60
-                elif strain_rate_unit == 'μm/hour':
-                    strain_rate_converted = strain_rate * time_factor * 1000 * 3600
-
-                # Store calculated data for export
-                self.parent.calculated_data = (time_converted, diameter_converted, diametrical_strain, strain_rate_converted)
-
-                # Plot data
-                axs[0, 0].plot(time_converted, diameter_converted, 'b-', label='Absolute Diameter')
-                axs[0, 1].plot(time_converted, diametrical_strain, 'r-', label='Diametrical Strain')
-                axs[1, 0].plot(time_converted, strain_rate_converted, 'g-', label='Strain Rate')
-                axs[1, 1].plot(diametrical_strain, strain_rate_converted, 'm-', label='Creep Rate vs Strain')
-
-                for pos, ax in [((0,0), axs[0,0]), ((0,1), axs[0,1]), 
-                              ((1,0), axs[1,0]), ((1,1), axs[1,1])]:
-                    x_scale, y_scale = self.parent.scales[pos]
-                    x_min, x_max, y_min, y_max = self.parent.ranges[pos]
-                    ax.set_xscale(x_scale)
-                    ax.set_yscale(y_scale)
-                    if x_min is not None and x_max is not None:
-                        ax.set_xlim(x_min, x_max)
-                    if y_min is not None and y_max is not None:
-                        ax.set_ylim(y_min, y_max)
-
-            # Set axis labels with units
+            data = pd.read_csv(buffer, header=header, usecols=[0, 1], dtype=np.float64,
+                               engine='c').to_numpy()
+        except pd.errors.EmptyDataError:
+            data = np.empty((0, 2))
+        return data[~np.isnan(data).any(axis=1)]
+
+    def _parse_rows_arrow(self, raw, end):
+        # Multi-threaded pyarrow parse of the time and diameter columns in raw[:end]
+        pa, pacsv = _pyarrow_csv()
+        if raw.find(b'\n') + 1 >= end:
+            return np.empty((0, 2))  # Header only (or nothing) so far
+        table = pacsv.read_csv(
+            pa.BufferReader(pa.py_buffer(memoryview(raw)[:end])),
+            read_options=pacsv.ReadOptions(use_threads=True, skip_rows=1, autogenerate_column_names=True),
+            convert_options=pacsv.ConvertOptions(include_columns=['f0', 'f1'],
+                                                 column_types={'f0': pa.float64(), 'f1': pa.float64()}))
+        data = np.column_stack((table.column(0).to_numpy(), table.column(1).to_numpy()))
+        return data[~np.isnan(data).any(axis=1)]
+
+    def _parse_partial_line(self, line):
+        # A final line without its newline may still be mid-write; skip it if it doesn't parse
+        if not line.strip():
+            return np.empty((0, 2))
+        try:
+            return self._parse_rows(io.BytesIO(line), None)
+        except ValueError:
+            return np.empty((0, 2))
+
+    def _read_rows(self, size):
+        # Returns all (time, diameter) rows, how many of them were already cached, and the
+        # (offset, complete rows, fingerprint) read state to commit once they are processed.
+        # When the file only grew, just the lines after the last complete one are parsed.
+        if self._cached_arrays is not None and 0 < self._last_offset <= size:
+            head, tail = self._fingerprint
+            with open(self.file_path, 'rb') as f:
+                file_head = f.read(len(head))
+                f.seek(self._last_offset - len(tail))
+                chunk = f.read()
+            if file_head == head and chunk[:len(tail)] == tail:  # Previously parsed data is still intact
+                chunk = chunk[len(tail):]
+                end = chunk.rfind(b'\n') + 1
+                new_rows = self._parse_rows(io.BytesIO(chunk[:end]), None)
+                partial = self._parse_partial_line(chunk[end:])
+                offset = self._last_offset + end
+                if end:
+                    tail = (tail + chunk[:end])[-FINGERPRINT_BYTES:]
+                n_cached = self._n_complete
+                time, diameter = (a[:n_cached] for a in self._cached_arrays[:2])
+                return (np.concatenate((time, new_rows[:, 0], partial[:, 0])),
+                        np.concatenate((diameter, new_rows[:, 1], partial[:, 1])), n_cached,
+                        (offset, n_cached + len(new_rows), (head, tail)))
+
+        # Full read; an unterminated final line is parsed now and re-read next time
+        with open(self.file_path, 'rb') as f:
+            raw = f.read()
+        end = raw.rfind(b'\n') + 1
+        data = None
+        if _pyarrow_csv() is not None:
+            pa, _ = _pyarrow_csv()
+            try:
+                data = self._parse_rows_arrow(raw, end)
+            except pa.ArrowInvalid:
+                pass  # e.g. rows with fewer fields than the header, which pandas pads with NaN
+        if data is None:
+            data = self._parse_rows(io.BytesIO(raw[:end]), 'infer')
+        partial = self._parse_partial_line(raw[end:]) if end else np.empty((0, 2))
+        fingerprint = (raw[:min(end, FINGERPRINT_BYTES)], raw[max(0, end - FINGERPRINT_BYTES):end])
+        rows = np.concatenate((data, partial))
+        return rows[:, 0], rows[:, 1], 0, (end, len(data), fingerprint)  # Time in seconds (base unit), diameter in mm
+
+    def _update_base_data(self, time, diameter, n_cached):
+        # Smooth diameter and compute base diametrical strain (unitless) and strain rate (1/s).
+        # Only the appended rows plus the smoothing/gradient window overlap are recomputed.
+        if self._cached_arrays is not None and n_cached >= 6:
+            _, _, cached_smooth, cached_strain, cached_rate = self._cached_arrays
+            if len(time) == n_cached == len(cached_smooth):
+                diameter_smooth, strain_base, strain_rate_base = cached_smooth, cached_strain, cached_rate
+            else:
+                # The segment's first two smoothed values and first three rates are edge
+                # estimates; the cached values are kept for those rows instead
+                start = n_cached - 6
+                smooth_tail, strain_tail, rate_tail = compute_base(time[start:], diameter[start:],
+                                                                   self.initial_diameter)
+                diameter_smooth = np.concatenate((cached_smooth[:start + 2], smooth_tail[2:]))
+                strain_base = np.concatenate((cached_strain[:start + 2], strain_tail[2:]))
+                strain_rate_base = np.concatenate((cached_rate[:start + 3], rate_tail[3:]))
+        else:
+            diameter_smooth, strain_base, strain_rate_base = compute_base(time, diameter,
+                                                                          self.initial_diameter)
+
+        arrays = (time, diameter, diameter_smooth, strain_base, strain_rate_base)
+        # Column-major (N, 4) array so each column is contiguous
+        base = np.empty((len(time), 4), order='F')
+        base[:, 0] = time
+        base[:, 1] = diameter_smooth
+        base[:, 2] = strain_base
+        base[:, 3] = strain_rate_base
+        return arrays, base
+
+    def compute(self):
+        # Only re-parse and re-smooth when the file itself changed; unit
+        # changes reuse the cached base-unit arrays (s, mm, unitless, 1/s)
+        if not self.file_path:
+            return
+        stat = os.stat(self.file_path)
+        self._last_size = stat.st_size
+        cache_key = (self.file_path, stat.st_mtime_ns, stat.st_size)
+        if self._cache is None or self._cache[0] != cache_key:
+            time, diameter, n_cached, read_state = self._read_rows(stat.st_size)
+            print(f"CSV rows: {len(time)}")  # Debug: Check data size
+            arrays, base = self._update_base_data(time, diameter, n_cached)
+            # Only advance the read state once the new rows were processed successfully
+            self._cached_arrays = arrays
+            self._last_offset, self._n_complete, self._fingerprint = read_state
+            self._cache = (cache_key, base)
+
+    def update_lines(self):
+        if self._cache is None:
+            return
+        base = self._cache[1]
+        if self._out is None or self._out.shape != base.shape:
+            self._out = np.empty(base.shape, order='F')
+        out = self._out
+
+        # Convert from base units (s, mm, 1/s) in place using the precomputed unit scales
+        time_scale, diameter_scale, rate_scale = self.parent.unit_scales
+        np.multiply(base[:, 0], time_scale, out=out[:, 0])
+        np.multiply(base[:, 1], diameter_scale, out=out[:, 1])
+        # Diametrical strain is unitless, so the cached value applies to any diameter unit
+        np.copyto(out[:, 2], base[:, 2])
+        np.multiply(base[:, 3], rate_scale, out=out[:, 3])
+
+        # Store calculated data for export, then update the plotted lines from it
+        self.parent.calculated_data = out
+        self.parent.update_display_data()
+
+    def apply_axes(self):
+        axs = self.parent.axs
+        for pos, ax in [((0,0), axs[0,0]), ((0,1), axs[0,1]), 
+                      ((1,0), axs[1,0]), ((1,1), axs[1,1])]:
+            x_scale, y_scale = self.parent.scales[pos]
+            x_min, x_max, y_min, y_max = self.parent.ranges[pos]
+            ax.relim()
+            ax.set_xscale(x_scale)
+            ax.set_yscale(y_scale)
+            if x_min is not None and x_max is not None:
+                ax.set_xlim(x_min, x_max)
+            else:
+                ax.autoscale(axis='x')
+            if y_min is not None and y_max is not None:
+                ax.set_ylim(y_min, y_max)
+            else:
+                ax.autoscale(axis='y')
+
+        # Set axis labels with units, only when a unit changed
+        time_unit = self.parent.time_unit_combo.currentText()
+        diameter_unit = self.parent.diameter_unit_combo.currentText()
+        strain_rate_unit = self.parent.strain_rate_unit_combo.currentText()
+        units = (time_unit, diameter_unit, strain_rate_unit)
+        if units != self._last_units:
             axs[0, 0].set_xlabel(f'Time ({time_unit})')
             axs[0, 0].set_ylabel(f'Diameter ({diameter_unit})')
             axs[0, 1].set_xlabel(f'Time ({time_unit})')
@@ -604,16 +1073,61 @@ class CSVEventHandler(FileSystemEventHandler):
             axs[1, 0].set_ylabel(f'Strain Rate ({strain_rate_unit})')
             axs[1, 1].set_xlabel('Diametrical Strain (unitless)')
             axs[1, 1].set_ylabel(f'Strain Rate ({strain_rate_unit})')
+            self._last_units = units
 
-            for ax in axs.flat:
-                ax.legend()
+    def draw(self):
+        self.parent.redraw_plots()
 
-            plt.tight_layout(pad=1.0)
-            QTimer.singleShot(0, self.parent.canvas.draw)  # Thread-safe GUI update
+    def _refresh(self, *steps):
+        try:
+            for step in steps:
+                step()
+            self.draw()
         except Exception as e:
             print(f"Error in plot_data: {e}")
             self.parent.label.setText(f"Plotting error: {e}")
 
+    def plot_data(self):
+        # File may have changed: re-read and compute on a worker thread; the
+        # finished signal then updates lines, axes and canvas on the GUI thread
+        if self._inflight:
+            self._rerun = True  # Overlapping requests collapse into one follow-up run
+            return
+        self._inflight = True
+        self._worker = PlotWorker(self)
+        self._worker.signals.finished.connect(self._on_computed)
+        self._worker.signals.error.connect(self._on_compute_error)
+        QThreadPool.globalInstance().start(self._worker)
+
+    def is_stale(self):
+        # The main window has switched to another handler (new file or refresh mode)
+        return self is not self.parent.event_handler
+
+    def _on_computed(self):
+        if not self.is_stale():
+            self._refresh(self.update_lines, self.apply_axes)
+        self._compute_done()
+
+    def _on_compute_error(self, message):
+        print(f"Error in plot_data: {message}")
+        if not self.is_stale():
+            self.parent.label.setText(f"Plotting error: {message}")
+        self._compute_done()
+
+    def _compute_done(self):
+        self._inflight = False
+        if self._rerun and not self.is_stale():
+            self._rerun = False
+            self.plot_data()
+
+    def update_units(self):
+        # Unit change: rescale the cached base arrays, no re-read
+        self._refresh(self.update_lines, self.apply_axes)
+
+    def update_axes(self):
+        # Scale or range change: only axes settings and the canvas are updated
+        self._refresh(self.apply_axes)
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)